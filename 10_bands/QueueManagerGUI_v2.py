@@ -1,9 +1,22 @@
 #!/usr/bin/env python3
 from __future__ import annotations
-import os, sys, json, subprocess, shutil, time
+import os, re, sys, json, shlex, subprocess, shutil, time
+from collections import deque
+from functools import lru_cache
 from datetime import datetime, timezone
 from PyQt6 import QtCore, QtGui, QtWidgets
 
+try:  # optional, much faster JSON decoding/encoding for ledger/state files
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
 APP_TITLE = "Headless Queue Manager (v2)"
 
 # Derive a sensible default repo path (two levels up from this file)
@@ -18,6 +31,48 @@ STATE_DIR = ".state"
 # Optional template search path (auto-loaded if exists)
 DEFAULT_TEMPLATES_REL = os.path.join("Config", "TaskTemplates.json")
 
+# Number of most recent ledger records shown in the ledger view
+LEDGER_TAIL = 500
+# Initial window read from the end of the ledger; doubled until it holds LEDGER_TAIL lines
+LEDGER_TAIL_WINDOW = 64 * 1024
+
+
+# Slow safety-net tick while the file watcher is attached; catches rotation on
+# filesystems or writers that replace the file without a change notification.
+TAILER_HOUSEKEEPING_MS = 10000
+# Keep the tailed log open between reads. Not on Windows, where an open handle
+# would stop the worker from moving/rotating the file.
+_KEEP_LOG_OPEN = os.name != "nt"
+# Lines read within this window are delivered in a single new_lines emit
+TAILER_COALESCE_MS = 50
+# Without a file watcher, idle polls back off up to poll_ms * this factor
+TAILER_MAX_BACKOFF = 4
+# At most this many lines per new_lines emit; the rest follow on the next flush
+TAILER_MAX_BATCH = 500
+# Undelivered lines kept during a burst; the oldest are dropped beyond this
+TAILER_MAX_PENDING = 10000
+# Lines kept in the live log document; older blocks are dropped by Qt
+MAX_LOG_BLOCKS = 5000
+# Bytes per positional read; a large backlog is consumed in several of these
+TAILER_READ_CHUNK = 256 * 1024
+
+
+# ANSI color/cursor sequences (e.g. from pwsh $PSStyle); stripped before display
+_RE_ANSI = re.compile(r"\x1b\[[0-9;?]*[A-Za-z]")
+
+
+def _pread(fd: int, n: int, pos: int) -> bytes:
+    # os.pread is POSIX-only; Windows gets seek + read on the same descriptor
+    if hasattr(os, "pread"):
+        return os.pread(fd, n, pos)
+    os.lseek(fd, pos, os.SEEK_SET)
+    return os.read(fd, n)
+
+
+def _is_network_path(path: str) -> bool:
+    # UNC paths (\\server\share or //server/share)
+    return path.startswith(("\\\\", "//"))
+
 
 class LogTailer(QtCore.QObject):
     new_lines = QtCore.pyqtSignal(list)
@@ -28,65 +83,405 @@ class LogTailer(QtCore.QObject):
         self.poll_ms = poll_ms
         self._timer = QtCore.QTimer(self)
         self._timer.timeout.connect(self._poll)
+        self._watcher = QtCore.QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._on_file_changed)
+        self._watcher.directoryChanged.connect(self._on_dir_changed)
         self._pos = 0
         self._inode = None
+        self._fd: int | None = None
+        # Trailing bytes of the last read that have no newline yet
+        self._tail = b""
+        # start() was called; the timer itself only runs while a path is set
+        self._running = False
+        self._pending: deque[str] = deque(maxlen=TAILER_MAX_PENDING)
+        self._flushTimer = QtCore.QTimer(self)
+        self._flushTimer.setSingleShot(True)
+        self._flushTimer.setInterval(TAILER_COALESCE_MS)
+        self._flushTimer.timeout.connect(self._flush)
 
     def start(self):
-        self._timer.start(self.poll_ms)
+        self._running = True
+        self._rewatch()
+        if not self.path:
+            # Nothing to tail; set_path() restarts once a log is attached
+            self._timer.stop()
+            return
+        # Change notifications drive reads; the timer is only a fallback
+        self._timer.start(TAILER_HOUSEKEEPING_MS if self._watching() else self.poll_ms)
+
+    def _watching(self) -> bool:
+        return bool(self._watcher.files() or self._watcher.directories())
 
     def stop(self):
+        self._running = False
         self._timer.stop()
+        self._unwatch()
+        self._close()
+        self._flushTimer.stop()
+        self._pending.clear()
+        self._tail = b""
+
+    def set_path(self, path: str):
+        if path == self.path:
+            return
+        self.path = path
+        self._close()
+        self._pos = 0
+        self._inode = None
+        self._tail = b""
+        if self._running:
+            self.start()
+
+    def _unwatch(self):
+        watched = self._watcher.files() + self._watcher.directories()
+        if watched:
+            self._watcher.removePaths(watched)
+
+    def _rewatch(self):
+        self._unwatch()
+        if not self.path or _is_network_path(self.path):
+            # Change notifications are unreliable on network shares; poll instead
+            return
+        # Watch the folder too so creation/rotation of the log is noticed
+        folder = os.path.dirname(self.path)
+        if folder and os.path.isdir(folder):
+            self._watcher.addPath(folder)
+        if os.path.exists(self.path):
+            self._watcher.addPath(self.path)
+
+    def _rearm(self) -> bool:
+        # Qt drops the watch when the file is removed or renamed; re-arm it
+        if (
+            self.path not in self._watcher.files()
+            and not _is_network_path(self.path)
+            and os.path.exists(self.path)
+        ):
+            return self._watcher.addPath(self.path)
+        return False
+
+    def _on_file_changed(self, _path: str):
+        self._rearm()
+        self._poll()
+
+    def _on_dir_changed(self, _path: str):
+        if self._rearm():
+            self._poll()
 
     def _poll(self):
+        if not self.path:
+            return
+        got = False
         try:
-            if not os.path.exists(self.path):
-                return
-            st = os.stat(self.path)
-            inode = (st.st_dev, getattr(st, "st_ino", st.st_size))
-            if self._inode != inode or st.st_size < self._pos:
-                self._pos = 0
-                self._inode = inode
-            with open(self.path, "r", encoding="utf-8", errors="replace") as f:
-                f.seek(self._pos)
-                chunk = f.read()
-                self._pos = f.tell()
-            if not chunk:
-                return
-            lines = [ln.rstrip() for ln in chunk.splitlines() if ln.strip()]
-            if lines:
-                self.new_lines.emit(lines)
+            # A single stat doubles as the existence check
+            self._check_rotation()
+            # Safety net for an inode swap that arrived without a notification
+            if self._rearm() and self._timer.isActive():
+                self._timer.setInterval(TAILER_HOUSEKEEPING_MS)
+            got = self._read_new()
+        except FileNotFoundError:
+            self._close()
         except Exception:
             pass
+        if self._timer.isActive() and not self._watching():
+            # Plain polling: slow down while the log is quiet, snap back on output
+            if got:
+                interval = self.poll_ms
+            else:
+                interval = min(self._timer.interval() * 2, self.poll_ms * TAILER_MAX_BACKOFF)
+            if interval != self._timer.interval():
+                self._timer.setInterval(interval)
+
+    def _check_rotation(self):
+        st = os.stat(self.path)
+        inode = (st.st_dev, getattr(st, "st_ino", st.st_size))
+        if self._inode != inode or st.st_size < self._pos:
+            self._close()
+            self._pos = 0
+            self._inode = inode
+            if self._tail:
+                # The old file is finished; its unterminated last line is complete
+                self._queue([self._tail.decode("utf-8", "replace")])
+                self._tail = b""
+
+    def _read_new(self) -> bool:
+        if self._fd is None:
+            self._fd = os.open(self.path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        got = False
+        try:
+            while True:
+                data = _pread(self._fd, TAILER_READ_CHUNK, self._pos)
+                if not data:
+                    break
+                self._pos += len(data)
+                got = True
+                # Only complete lines are delivered; a partially written one (or a
+                # multi-byte character cut by the chunk edge) waits for its newline
+                done, nl, self._tail = (self._tail + data).rpartition(b"\n")
+                if nl:
+                    self._queue(done.decode("utf-8", "replace").split("\n"))
+                if len(data) < TAILER_READ_CHUNK:
+                    break
+        finally:
+            if not _KEEP_LOG_OPEN:
+                self._close()
+        return got
+
+    def _queue(self, raw_lines: list[str]):
+        lines = [
+            (_RE_ANSI.sub("", ln) if "\x1b" in ln else ln).rstrip()
+            for ln in raw_lines
+            if ln.strip()
+        ]
+        lines = [ln for ln in lines if ln]
+        if lines:
+            self._pending.extend(lines)
+            if not self._flushTimer.isActive():
+                self._flushTimer.start()
+
+    def _flush(self):
+        pending = self._pending
+        if not pending:
+            return
+        n = min(len(pending), TAILER_MAX_BATCH)
+        lines = [pending.popleft() for _ in range(n)]
+        if pending:
+            self._flushTimer.start()  # deliver the remainder after the GUI catches up
+        self.new_lines.emit(lines)
+
+    def _close(self):
+        if self._fd is not None:
+            try:
+                os.close(self._fd)
+            except Exception:
+                pass
+            self._fd = None
 
 
 def color_for_line(line: str) -> str:
+    # str.lower() + `in` keeps CPython's fast literal scan; an IGNORECASE regex
+    # search is several times slower on typical worker lines
     low = line.lower()
-    if (
-        "error" in low
-        or "[error]" in low
-        or " fail " in low
-        or low.endswith(" fail")
-        or "timeout" in low
-    ):
+    if "error" in low or " fail " in low or low.endswith(" fail") or "timeout" in low:
         return "#ff4444"
     if "warn" in low:
         return "#ffaa00"
-    if "ok" in low or "success" in low or "quality gate: ok" in low:
+    if "ok" in low or "success" in low:
         return "#44bb44"
     return "#cccccc"
 
 
+if sys.version_info >= (3, 11):
+    _parse_iso = datetime.fromisoformat  # accepts a trailing "Z" natively
+else:
+    def _parse_iso(s: str) -> datetime:
+        return datetime.fromisoformat(s.replace("Z", "+00:00"))
+
+
+@lru_cache(maxsize=4096)
+def _format_mtime(mtime: float) -> str:
+    # DLQ files rarely change, so refreshes keep hitting the same timestamps
+    return datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _scan_jsonl(folder: str) -> list[tuple[str, str, float]]:
+    """Return (name, path, mtime) for the *.jsonl files in `folder`, sorted by name.
+
+    One directory read via os.scandir; DirEntry caches the type and, on most
+    platforms, the stat result, so no per-file path joins or extra lookups.
+    """
+    try:
+        with os.scandir(folder) as it:
+            entries = [e for e in it if e.name.endswith(".jsonl") and e.is_file()]
+    except OSError:
+        return []
+    rows = []
+    for e in sorted(entries, key=lambda e: e.name):
+        try:
+            rows.append((e.name, e.path, e.stat().st_mtime))
+        except OSError:
+            continue  # moved away by the worker mid-scan
+    return rows
+
+
+def _move_file(src: str, dst: str):
+    # A single rename when both sides share a filesystem; copy+delete otherwise
+    try:
+        os.replace(src, dst)
+    except FileNotFoundError:
+        if not os.path.exists(src):
+            raise  # already moved or removed by someone else; caller skips it
+        # The destination folder was deleted under us: recreate it and retry
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        os.replace(src, dst)
+    except OSError:
+        shutil.move(src, dst)
+
+
+def _atomic_write_bytes(path: str, data: bytes):
+    """Write `data` to a sibling temp file, then os.replace() it onto `path`.
+
+    Readers (the worker scanning the inbox, the breaker view) never see a torn
+    file. The temp name ends in ".tmp", so "*.jsonl" scans skip it.
+    """
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+class _PoolSignals(QtCore.QObject):
+    done = QtCore.pyqtSignal(object)
+
+
+class _PoolJob(QtCore.QRunnable):
+    """Run `fn(*args)` on a pool thread and emit its result as `signals.done`.
+
+    The signals object is created on the constructing (GUI) thread, so the emit
+    is queued back onto it. `fn` reports its own errors in the result; an
+    exception escaping run() would abort the process under PyQt6.
+    """
+
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = _PoolSignals()
+
+    def run(self):
+        self.signals.done.emit(self.fn(*self.args))
+
+
+def _scan_dlq(gen: int, folders) -> tuple[int, list]:
+    # `gen` is handed back so the receiver can drop a scan a newer one superseded
+    return gen, [_scan_jsonl(f) for f in folders]
+
+
+def _format_ledger_line(raw: bytes) -> tuple[str, str | None]:
+    # Both orjson and json accept UTF-8 bytes, so only non-JSON lines get decoded
+    try:
+        obj = _json_loads(raw)
+        ts = obj.get("ts", "")
+        tid = obj.get("id", "")
+        tool = obj.get("tool", "")
+        ok = obj.get("ok", False)
+        exitc = obj.get("exit", "")
+        txt = f"{ts}  [{tool}] id={tid}  {'OK' if ok else 'FAIL'} (code={exitc})"
+        return txt, ("#44bb44" if ok else "#ff4444")
+    except Exception:
+        return raw.decode("utf-8", "replace"), None
+
+
+def _write_file(path: str, payload: bytes) -> tuple[str, str]:
+    """Atomically write `payload` to `path`, recreating a vanished parent folder.
+
+    Returns (path, error message); the message is "" on success.
+    """
+    try:
+        try:
+            _atomic_write_bytes(path, payload)
+        except FileNotFoundError:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            _atomic_write_bytes(path, payload)
+    except Exception as e:
+        return path, str(e)
+    return path, ""
+
+
+def _launch_detached(args, popen_kwargs: dict) -> str:
+    # pwsh can take a noticeable moment to spawn on Windows, hence the pool thread
+    try:
+        subprocess.Popen(args, **popen_kwargs)
+    except Exception as e:
+        return str(e)
+    return ""
+
+
+def _ledger_tail_start(f, size: int) -> int:
+    """Return the offset of a line start with at least LEDGER_TAIL lines after it.
+
+    Reads growing windows from the end of `f` so a large ledger is never read in
+    full; returns 0 when the whole file is needed.
+    """
+    window = LEDGER_TAIL_WINDOW
+    while window < size:
+        f.seek(size - window)
+        data = f.read(window)
+        if data.count(b"\n") > LEDGER_TAIL:
+            # Skip the partial line the window starts in
+            return size - window + data.index(b"\n") + 1
+        window *= 2
+    return 0
+
+
+def _parse_ledger(path: str, prev_sig, prev_pos: int) -> dict:
+    """Parse ledger records appended after `prev_pos` (runs on a pool thread).
+
+    Returns either {"missing": True}, {"error": str} or {"sig", "pos", "reset",
+    "fresh"} where `fresh` holds at most LEDGER_TAIL formatted (text, color)
+    records.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return {"missing": True}
+    try:
+        sig = (path, st.st_dev, getattr(st, "st_ino", 0))
+        pos = prev_pos
+        reset = sig != prev_sig or st.st_size < pos
+        if reset:
+            pos = 0
+        # Only the newest LEDGER_TAIL records can be shown; keep no more than that
+        fresh = deque(maxlen=LEDGER_TAIL)
+        if st.st_size > pos:
+            # Stream line by line so peak memory is the read buffer, not the file
+            with open(path, "rb", buffering=1 << 20) as f:
+                if pos == 0:
+                    pos = _ledger_tail_start(f, st.st_size)
+                f.seek(pos)
+                for raw in f:
+                    if not raw.endswith(b"\n"):
+                        break  # partially written record; picked up next refresh
+                    pos += len(raw)
+                    raw = raw.strip()
+                    if raw:
+                        fresh.append(_format_ledger_line(raw))
+        return {"sig": sig, "pos": pos, "reset": reset, "fresh": list(fresh)}
+    except Exception as e:
+        return {"error": str(e)}
+
+
+# Compiled once; the config readers run on every dialog open / path refresh
+_RE_TOOL_NAME = re.compile(r"Name\s*=\s*'(.*?)'")
+# Tool names per config path, reused while (st_mtime_ns, st_size) is unchanged
+_TOOL_NAMES_CACHE: dict[str, tuple[tuple[int, int], tuple[str, ...]]] = {}
+# One pass over SharedConfig.psd1 for all three roots
+_RE_SHARED_PATH = re.compile(r"(?P<key>TasksRoot|LogsRoot|StateRoot)\s*=\s*'(?P<value>[^']+)'")
+
+
 def get_tool_names_from_config(repo_path: str) -> list[str]:
     config_path = os.path.join(repo_path, "Config", "CliToolsConfig.psd1")
-    if not os.path.exists(config_path):
+    try:
+        st = os.stat(config_path)
+    except OSError:
         return []
+    sig = (st.st_mtime_ns, st.st_size)
+    hit = _TOOL_NAMES_CACHE.get(config_path)
+    if hit is not None and hit[0] == sig:
+        return list(hit[1])
     try:
         with open(config_path, "r", encoding="utf-8") as f:
             content = f.read()
         # This is a simplified parser for .psd1 files. It's not a full-fledged
         # PowerShell parser, but it's good enough for this specific file format.
-        import re
-        tool_names = re.findall(r"Name\s*=\s*\'(.*?)\'", content)
+        tool_names = _RE_TOOL_NAME.findall(content)
+        _TOOL_NAMES_CACHE[config_path] = (sig, tuple(tool_names))
         return tool_names
     except Exception:
         return []
@@ -140,12 +535,12 @@ def _read_shared_paths_fallback(repo_path: str) -> dict | None:
         txt = open(psd1, "r", encoding="utf-8").read()
     except Exception:
         return None
-    import re
     paths_block = {}
-    for key in ("TasksRoot", "LogsRoot", "StateRoot"):
-        m = re.search(rf"{key}\s*=\s*'([^']+)'", txt)
-        if m:
-            paths_block[key] = m.group(1)
+    for m in _RE_SHARED_PATH.finditer(txt):
+        # First occurrence wins, as with a per-key search
+        paths_block.setdefault(m.group("key"), m.group("value"))
+        if len(paths_block) == 3:
+            break
     return paths_block or None
 
 
@@ -164,8 +559,45 @@ def get_shared_paths(repo_path: str) -> dict:
         state = os.path.join(repo_path, state)
     return {"TasksRoot": tasks, "LogsRoot": logs, "StateRoot": state}
 
+def _split_args(text: str) -> list[str]:
+    """Split an args/flags field, honoring "quoted words".
+
+    Only double quotes group words; apostrophes (it's, don't) stay literal.
+    Backslashes are kept literally so Windows paths survive; unbalanced quotes
+    fall back to a plain whitespace split.
+    """
+    if '"' not in text:
+        return text.split()
+    lex = shlex.shlex(text, posix=True)
+    lex.whitespace_split = True
+    lex.quotes = '"'
+    lex.escape = ""
+    lex.commenters = ""
+    try:
+        return list(lex)
+    except ValueError:
+        return text.split()
+
+
+def _join_args(values: list[str]) -> str:
+    # Only wrap values _split_args can read back. A value containing '"' has no
+    # quoting that survives the split, so it is shown as-is and kept intact only
+    # through the dialog's unedited-seed reuse.
+    return " ".join(
+        f'"{v}"' if '"' not in v and (not v or any(c.isspace() for c in v)) else v
+        for v in values
+    )
+
+
 class AddTaskDialog(QtWidgets.QDialog):
-    def __init__(self, repo_path: str, tool_names: list[str], seed: dict | None = None, parent=None):
+    def __init__(
+        self,
+        repo_path: str,
+        tool_names: list[str] | None = None,
+        seed: dict | None = None,
+        parent=None,
+        tool_model: QtCore.QStringListModel | None = None,
+    ):
         super().__init__(parent)
         self.setWindowTitle("Add Task (JSONL)")
         self.setModal(True)
@@ -173,7 +605,11 @@ class AddTaskDialog(QtWidgets.QDialog):
         layout = QtWidgets.QFormLayout(self)
 
         self.tool = QtWidgets.QComboBox()
-        self.tool.addItems(tool_names)
+        if tool_model is not None:
+            # Shared, already-populated model; nothing to insert per dialog
+            self.tool.setModel(tool_model)
+        elif tool_names:
+            self.tool.addItems(tool_names)
         self.repo = QtWidgets.QLineEdit(repo_path)
         self.args = QtWidgets.QLineEdit()
         self.flags = QtWidgets.QLineEdit()
@@ -182,11 +618,13 @@ class AddTaskDialog(QtWidgets.QDialog):
         self.timeout = QtWidgets.QSpinBox()
         self.timeout.setRange(0, 86400)
         self.timeout.setValue(900)
+        # field -> (text shown for the seed, original list); reused if left unedited
+        self._seedLists: dict[str, tuple[str, list]] = {}
 
         layout.addRow("Tool", self.tool)
         layout.addRow("Repo", self.repo)
-        layout.addRow("Args (space-separated)", self.args)
-        layout.addRow("Flags (space-separated)", self.flags)
+        layout.addRow('Args (space-separated; "quote" multi-word values)', self.args)
+        layout.addRow('Flags (space-separated; "quote" multi-word values)', self.flags)
         layout.addRow("Files (comma-separated)", self.files)
         layout.addRow("Prompt (optional)", self.prompt)
         layout.addRow("Timeout (sec, 0 = none)", self.timeout)
@@ -203,17 +641,19 @@ class AddTaskDialog(QtWidgets.QDialog):
             self.apply_seed(seed)
 
     def apply_seed(self, seed: dict):
-        def join_list(v):
-            return " ".join(v) if isinstance(v, list) else (v or "")
-
         if "tool" in seed:
             self.tool.setCurrentText(str(seed["tool"]))
         if "repo" in seed:
             self.repo.setText(str(seed["repo"]))
-        if "args" in seed:
-            self.args.setText(join_list(seed["args"]))
-        if "flags" in seed:
-            self.flags.setText(join_list(seed["flags"]))
+        for key, edit in (("args", self.args), ("flags", self.flags)):
+            if key in seed:
+                v = seed[key]
+                if isinstance(v, list):
+                    text = _join_args(v)
+                    self._seedLists[key] = (text, list(v))
+                else:
+                    text = v or ""
+                edit.setText(text)
         if "files" in seed:
             self.files.setText(
                 ", ".join(seed["files"]) if isinstance(seed["files"], list) else str(seed["files"])
@@ -226,6 +666,12 @@ class AddTaskDialog(QtWidgets.QDialog):
             except:
                 pass
 
+    def _field_list(self, key: str, text: str) -> list[str]:
+        seeded = self._seedLists.get(key)
+        if seeded is not None and seeded[0] == text:
+            return list(seeded[1])
+        return _split_args(text)
+
     def build_task(self) -> dict:
         task = {
             "id": datetime.now().strftime("%Y%m%d%H%M%S"),
@@ -233,40 +679,120 @@ class AddTaskDialog(QtWidgets.QDialog):
             "repo": self.repo.text().strip() or self.repo_path,
             "timeout_sec": int(self.timeout.value()),
         }
-        if self.args.text().strip():
-            task["args"] = self.args.text().strip().split()
-        if self.flags.text().strip():
-            task["flags"] = self.flags.text().strip().split()
-        if self.files.text().strip():
-            task["files"] = [p.strip() for p in self.files.text().split(",") if p.strip()]
+        # Read each field once; text() copies the QString on every call
+        args = self._field_list("args", self.args.text())
+        flags = self._field_list("flags", self.flags.text())
+        files = [p.strip() for p in self.files.text().split(",") if p.strip()]
+        if args:
+            task["args"] = args
+        if flags:
+            task["flags"] = flags
+        if files:
+            task["files"] = files
         ptxt = self.prompt.toPlainText().strip()
         if ptxt:
             task["prompt"] = ptxt
         return task
 
 
+def _parse_templates(raw: bytes) -> dict | None:
+    # Windows PowerShell writes a UTF-8 BOM, which orjson rejects
+    data = _json_loads(raw[3:] if raw.startswith(b"\xef\xbb\xbf") else raw)
+    if isinstance(data, list):
+        # list of {name, task}
+        return {
+            item.get("name", f"Template {i + 1}"): item.get("task", {})
+            for i, item in enumerate(data)
+        }
+    if isinstance(data, dict):
+        return data
+    return None
+
+
+def _read_templates(gen: int, path: str) -> tuple[int, str, tuple | None, dict | None]:
+    # Pool-thread half of TemplatesModel.load_async; templates is None when the
+    # file is unreadable or not a list/dict
+    try:
+        st = os.stat(path)
+        with open(path, "rb") as f:
+            return gen, path, (st.st_mtime_ns, st.st_size), _parse_templates(f.read())
+    except Exception:
+        return gen, path, None, None
+
+
 class TemplatesModel(QtCore.QObject):
     changed = QtCore.pyqtSignal()
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.templates = {}  # name -> dict
+        # Bumped whenever `templates` is replaced; lets views skip redundant rebuilds
+        self.revision = 0
+        self._sortedRev = -1
+        self._sortedNames: list[str] = []
+        # path -> ((mtime_ns, size), templates) for files loaded before
+        self._loadCache: dict[str, tuple[tuple[int, int], dict]] = {}
+        self._loadGen = 0
+
+    def sorted_names(self) -> list[str]:
+        if self._sortedRev != self.revision:
+            self._sortedNames = sorted(self.templates)
+            self._sortedRev = self.revision
+        return self._sortedNames
+
+    def _emit_changed(self):
+        self.revision += 1
+        self.changed.emit()
+
+    def _use_cached(self, path: str, sig: tuple[int, int]) -> bool:
+        hit = self._loadCache.get(path)
+        if hit is None or hit[0] != sig:
+            return False
+        # Unchanged file: reuse the parsed templates, notify only if they differ
+        if self.templates is not hit[1]:
+            self.templates = hit[1]
+            self._emit_changed()
+        return True
+
+    def _apply(self, path: str, sig: tuple[int, int], templates: dict):
+        self.templates = templates
+        self._loadCache[path] = (sig, templates)
+        self._emit_changed()
 
     def load(self, path: str):
+        self._loadGen += 1  # a synchronous load supersedes any pending async one
         try:
-            data = json.load(open(path, "r", encoding="utf-8"))
-            if isinstance(data, list):
-                # list of {name, task}
-                self.templates = {
-                    item.get("name", f"Template {i + 1}"): item.get("task", {})
-                    for i, item in enumerate(data)
-                }
-            elif isinstance(data, dict):
-                self.templates = data
-            self.changed.emit()
+            st = os.stat(path)
+            sig = (st.st_mtime_ns, st.st_size)
+            if self._use_cached(path, sig):
+                return
+            with open(path, "rb") as f:
+                templates = _parse_templates(f.read())
+            if templates is not None:
+                self._apply(path, sig, templates)
         except Exception:
             pass
 
+    def load_async(self, path: str):
+        """Like load(), but reads and parses on the global thread pool."""
+        self._loadGen += 1
+        try:
+            st = os.stat(path)
+            if self._use_cached(path, (st.st_mtime_ns, st.st_size)):
+                return
+        except Exception:
+            return
+        job = _PoolJob(_read_templates, self._loadGen, path)
+        job.signals.done.connect(self._on_loaded)
+        QtCore.QThreadPool.globalInstance().start(job)
+
+    def _on_loaded(self, result: tuple):
+        gen, path, sig, templates = result
+        # Drop results from a load that a newer one has superseded
+        if gen != self._loadGen or templates is None:
+            return
+        self._apply(path, sig, templates)
+
     def builtin(self):
         self.templates = {
             "Git: fetch + prune": {"tool": "git", "args": ["fetch", "--all", "--prune"]},
@@ -283,7 +809,7 @@ class TemplatesModel(QtCore.QObject):
                 "timeout_sec": 1200,
             },
         }
-        self.changed.emit()
+        self._emit_changed()
 
 
 class MainWindow(QtWidgets.QMainWindow):
@@ -293,11 +819,29 @@ class MainWindow(QtWidgets.QMainWindow):
         self.resize(1320, 860)
         self._lastStopAt = 0.0
         self._cooldownSec = 3
+        # Ledger records parsed so far; refreshes only parse appended bytes
+        self._ledger_sig = None
+        self._ledger_pos = 0
+        self._ledger_entries = deque(maxlen=LEDGER_TAIL)
+        # True while ledgerList mirrors _ledger_entries and can be appended to
+        self._ledger_synced = False
+        # Placeholder text currently shown in ledgerList instead of records
+        self._ledger_message = None
+        # Parsing runs on the global thread pool; one job in flight at a time
+        self._ledgerBusy = False
+        self._ledgerAgain = False
+        # Resolved repo/tasks/logs/state dirs plus the SharedConfig "roots" (whose
+        # get_shared_paths() may spawn PowerShell). A path field change drops
+        # only the entries derived from it.
+        self._dir_cache: dict[str, str | dict] = {}
 
         # === Top paths & control ===
         self.repoEdit = QtWidgets.QLineEdit(DEFAULT_REPO)
+        self.repoEdit.textChanged.connect(self._dir_cache.clear)
         self.tasksEdit = QtWidgets.QLineEdit("")
+        self.tasksEdit.textChanged.connect(lambda _t: self._dir_cache.pop("tasks", None))
         self.logsEdit = QtWidgets.QLineEdit("")
+        self.logsEdit.textChanged.connect(lambda _t: self._dir_cache.pop("logs", None))
         self.btnRepo = QtWidgets.QPushButton("Repo…")
         self.btnRepo.clicked.connect(self.choose_repo)
         self.btnTasks = QtWidgets.QPushButton(".tasks…")
@@ -324,8 +868,13 @@ class MainWindow(QtWidgets.QMainWindow):
         self.btnRetryFailed.clicked.connect(self.retry_failed)
         self.btnOpenTasks.clicked.connect(lambda: self.open_folder(self.tasks_dir()))
         self.btnOpenLogs.clicked.connect(lambda: self.open_folder(self.logs_dir()))
-        self.btnClearLog.clicked.connect(lambda: (hasattr(self, 'liveLog') and self.liveLog.clear()))
-        self.btnRefreshLedger.clicked.connect(self.load_ledger)
+        self.btnClearLog.clicked.connect(self.clear_log)
+        # Coalesce bursts of refresh requests into a single ledger reload
+        self._ledgerRefresh = QtCore.QTimer(self)
+        self._ledgerRefresh.setSingleShot(True)
+        self._ledgerRefresh.setInterval(200)
+        self._ledgerRefresh.timeout.connect(self.load_ledger)
+        self.btnRefreshLedger.clicked.connect(lambda: self._ledgerRefresh.start())
         self.btnRefreshDLQ.clicked.connect(self.refresh_dlq)
         self.btnRefreshCB.clicked.connect(self.refresh_breakers)
         self.btnForceCloseCB.clicked.connect(self.force_close_breaker)
@@ -340,6 +889,9 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # Templates
         self.templates = TemplatesModel(self)
+        # Tool names shared by every AddTaskDialog
+        self._toolModel = QtCore.QStringListModel(self)
+        self._templatesRevSeen = -1
         self.templates.builtin()  # start with built-ins
         self.templatePicker = QtWidgets.QComboBox()
         self.templates.changed.connect(self.refresh_templates)
@@ -383,12 +935,43 @@ class MainWindow(QtWidgets.QMainWindow):
         self.lblStatus = QtWidgets.QLabel("Stopped")
         self.status.addPermanentWidget(self.lblStatus)
 
+        # Parsed state files keyed by path -> ((mtime_ns, size), hash(bytes), data)
+        self._json_cache: dict[str, tuple[tuple[int, int], int, object]] = {}
+        # Last heartbeat timestamp string and its parsed value
+        self._hbParsed: tuple[str, datetime | None] = ("", None)
+
+        # Live log: one QTextCharFormat per color, built on first use
+        self._logFormats: dict[str, QtGui.QTextCharFormat] = {}
+        # Lines that arrived while the live log was hidden; appended when it shows
+        self._hiddenLog: deque[str] = deque(maxlen=MAX_LOG_BLOCKS)
+
         # Timers
         self.tailer = LogTailer("", poll_ms=700, parent=self)
         self.tailer.new_lines.connect(self.on_new_log_lines)
         self.hbTimer = QtWidgets.QTimer(self)
         self.hbTimer.setInterval(1000)
         self.hbTimer.timeout.connect(self.check_heartbeat)
+        # DLQ folders and circuit_breakers.json are refreshed when they change
+        # rather than rescanned on demand; bursts of worker moves coalesce.
+        self._fsw = QtCore.QFileSystemWatcher(self)
+        self._fsw.directoryChanged.connect(self._on_watched_path_changed)
+        self._fsw.fileChanged.connect(self._on_watched_path_changed)
+        self._dlqRefresh = QtCore.QTimer(self)
+        self._dlqRefresh.setSingleShot(True)
+        self._dlqRefresh.setInterval(200)
+        self._dlqRefresh.timeout.connect(self.refresh_dlq)
+        self._dlqGen = 0
+        self._ensured_dirs: set[str] = set()
+        # Task files are written off the GUI thread; one thread keeps them in order
+        self._io_pool = QtCore.QThreadPool(self)
+        self._io_pool.setMaxThreadCount(1)
+        # Typing in a path field re-points the watches once the edits settle
+        self._pathsDebounce = QtCore.QTimer(self)
+        self._pathsDebounce.setSingleShot(True)
+        self._pathsDebounce.setInterval(300)
+        self._pathsDebounce.timeout.connect(self._on_paths_edited)
+        for edit in (self.repoEdit, self.tasksEdit, self.logsEdit):
+            edit.textChanged.connect(self._pathsDebounce.start)
 
         self.update_default_paths()
         self.tailer.start()
@@ -398,7 +981,10 @@ class MainWindow(QtWidgets.QMainWindow):
         # Limit live log memory; wire error list double-click to open file
         if hasattr(self, 'liveLog') and hasattr(self.liveLog, 'document'):
             try:
-                self.liveLog.document().setMaximumBlockCount(10000)
+                self.liveLog.document().setMaximumBlockCount(MAX_LOG_BLOCKS)
+                # Read-only viewer: don't keep an undo stack of every appended batch
+                self.liveLog.setUndoRedoEnabled(False)
+                self.liveLog.installEventFilter(self)
             except Exception:
                 pass
         if hasattr(self, 'errorsList'):
@@ -409,25 +995,41 @@ class MainWindow(QtWidgets.QMainWindow):
 
     # ===== Paths/helpers =====
     def repo_dir(self) -> str:
-        return self.repoEdit.text().strip() or DEFAULT_REPO
+        p = self._dir_cache.get("repo")
+        if p is None:
+            p = self._dir_cache["repo"] = self.repoEdit.text().strip() or DEFAULT_REPO
+        return p
 
     def tasks_dir(self) -> str:
-        p = self.tasksEdit.text().strip()
-        if not p:
-            p = get_shared_paths(self.repo_dir())["TasksRoot"]
+        p = self._dir_cache.get("tasks")
+        if p is None:
+            p = self.tasksEdit.text().strip() or self._shared_paths()["TasksRoot"]
+            self._dir_cache["tasks"] = p
         return p
 
     def logs_dir(self) -> str:
-        p = self.logsEdit.text().strip()
-        if not p:
-            p = get_shared_paths(self.repo_dir())["LogsRoot"]
+        p = self._dir_cache.get("logs")
+        if p is None:
+            p = self.logsEdit.text().strip() or self._shared_paths()["LogsRoot"]
+            self._dir_cache["logs"] = p
         return p
 
     def state_dir(self) -> str:
-        return get_shared_paths(self.repo_dir())["StateRoot"]
+        p = self._dir_cache.get("state")
+        if p is None:
+            p = self._dir_cache["state"] = self._shared_paths()["StateRoot"]
+        return p
+
+    def _shared_paths(self) -> dict:
+        roots = self._dir_cache.get("roots")
+        if roots is None:
+            roots = self._dir_cache["roots"] = get_shared_paths(self.repo_dir())
+        return roots
 
     def update_default_paths(self):
-        roots = get_shared_paths(self.repo_dir())
+        # Re-read SharedConfig here; everything else uses the cached roots
+        self._dir_cache.clear()
+        roots = self._shared_paths()
         self.tasksEdit.setPlaceholderText(roots["TasksRoot"])
         self.logsEdit.setPlaceholderText(roots["LogsRoot"])
         # Populate from SharedConfig when fields are empty
@@ -436,15 +1038,75 @@ class MainWindow(QtWidgets.QMainWindow):
         if not self.logsEdit.text().strip():
             self.logsEdit.setText(roots["LogsRoot"])
         for p in [self.tasks_dir(), self.logs_dir(), self.state_dir()]:
-            os.makedirs(p, exist_ok=True)
-        self.tailer.path = os.path.join(self.logs_dir(), "queueworker.log")
+            self._ensure_dir(p)
+        self._pathsDebounce.stop()  # the setText calls above need no second pass
+        self._apply_paths()
+
+    def _on_paths_edited(self):
+        # Typed paths may be half-finished: follow them, but create no folders
+        roots = self._shared_paths()
+        self.tasksEdit.setPlaceholderText(roots["TasksRoot"])
+        self.logsEdit.setPlaceholderText(roots["LogsRoot"])
+        self._apply_paths()
+
+    def _apply_paths(self):
+        self.tailer.set_path(os.path.join(self.logs_dir(), "queueworker.log"))
+        self._rewatch_state_files()
         self.refresh_breakers()
+        self._dlqRefresh.start()
+
+    def _rewatch_state_files(self):
+        watched = self._fsw.files() + self._fsw.directories()
+        if watched:
+            self._fsw.removePaths(watched)
+        # The parent folders are watched too, so DLQ folders or a breakers file
+        # created after startup are picked up without polling
+        paths = [
+            *self._dlq_folders(),
+            self.breakers_path(),
+            self.tasks_dir(),
+            self.state_dir(),
+        ]
+        existing = [p for p in paths if os.path.exists(p)]
+        if existing:
+            self._fsw.addPaths(existing)
+
+    def _on_watched_path_changed(self, path: str):
+        bp = self.breakers_path()
+        if path == bp:
+            # Writers that replace the file drop the watch; re-arm it
+            if path not in self._fsw.files() and os.path.exists(path):
+                self._fsw.addPath(path)
+            self.refresh_breakers()
+        elif path == self.state_dir():
+            # Heartbeat writes land here too; only react once the breakers file appears
+            if bp not in self._fsw.files() and os.path.exists(bp):
+                self._fsw.addPath(bp)
+                self.refresh_breakers()
+        elif path == self.tasks_dir():
+            # A subfolder (e.g. inbox) may have been deleted; make _ensure_dir recreate it
+            self._ensured_dirs = {p for p in self._ensured_dirs if os.path.isdir(p)}
+            watched = self._fsw.directories()
+            added = [p for p in self._dlq_folders() if p not in watched and os.path.isdir(p)]
+            if added:
+                self._fsw.addPaths(added)
+                self._dlqRefresh.start()
+        else:
+            self._dlqRefresh.start()
 
     # ===== UI actions =====
+    def _ensure_dir(self, path: str):
+        # Skip the makedirs syscalls for folders this session already created
+        if path in self._ensured_dirs:
+            return
+        os.makedirs(path, exist_ok=True)
+        self._ensured_dirs.add(path)
+
     def choose_repo(self):
         d = QtWidgets.QFileDialog.getExistingDirectory(self, "Choose Repo", self.repo_dir())
         if d:
             self.repoEdit.setText(d)
+            self._ensured_dirs.clear()
             self.update_default_paths()
             self.try_load_default_templates()
 
@@ -452,12 +1114,15 @@ class MainWindow(QtWidgets.QMainWindow):
         d = QtWidgets.QFileDialog.getExistingDirectory(self, "Choose .tasks", self.tasks_dir())
         if d:
             self.tasksEdit.setText(d)
+            self._ensured_dirs.clear()
+            self._rewatch_state_files()
 
     def choose_logs(self):
         d = QtWidgets.QFileDialog.getExistingDirectory(self, "Choose logs", self.logs_dir())
         if d:
             self.logsEdit.setText(d)
-            self.tailer.path = os.path.join(self.logs_dir(), "queueworker.log")
+            self._ensured_dirs.clear()
+            self.tailer.set_path(os.path.join(self.logs_dir(), "queueworker.log"))
 
     def start_worker(self):
         sup = os.path.join(self.repo_dir(), "scripts", "Supervisor.ps1")
@@ -475,13 +1140,18 @@ class MainWindow(QtWidgets.QMainWindow):
             pwsh = _which("pwsh")
             ps5 = _which("powershell")
             if pwsh:
-                subprocess.Popen([pwsh, "-NoProfile", "-File", sup])
+                job = _PoolJob(_launch_detached, [pwsh, "-NoProfile", "-File", sup], {})
             elif os.name == "nt" and ps5:
                 cmd = f'"{ps5}" -NoProfile -ExecutionPolicy Bypass -File "{sup}"'
-                subprocess.Popen(
+                job = _PoolJob(
+                    _launch_detached,
                     cmd,
-                    shell=True,
-                    creationflags=subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP,
+                    {
+                        "shell": True,
+                        "creationflags": (
+                            subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+                        ),
+                    },
                 )
             else:
                 QtWidgets.QMessageBox.critical(
@@ -490,10 +1160,19 @@ class MainWindow(QtWidgets.QMainWindow):
                     "PowerShell 7+ (pwsh) not found. Install from https://aka.ms/powershell",
                 )
                 return
+            # Spawn off the GUI thread; failures come back through the signal
+            job.signals.done.connect(self._on_launch_done)
+            QtCore.QThreadPool.globalInstance().start(job)
             self.lblStatus.setText("Worker: starting…")
         except Exception as e:
             QtWidgets.QMessageBox.critical(self, "Error", str(e))
 
+    def _on_launch_done(self, err: str):
+        if not err:
+            return
+        self.lblStatus.setText("Worker: failed to start")
+        QtWidgets.QMessageBox.critical(self, "Error", err)
+
     def stop_worker(self):
         stopfile = os.path.join(self.repo_dir(), "STOP.HEADLESS")
         try:
@@ -510,9 +1189,18 @@ class MainWindow(QtWidgets.QMainWindow):
 
     # ===== Templates =====
     def refresh_templates(self):
-        self.templatePicker.clear()
-        for name in sorted(self.templates.templates.keys()):
-            self.templatePicker.addItem(name)
+        if self._templatesRevSeen == self.templates.revision:
+            return
+        self._templatesRevSeen = self.templates.revision
+        picker = self.templatePicker
+        # One bulk insert; no per-item index-changed signals or repaints
+        with QtCore.QSignalBlocker(picker):
+            picker.setUpdatesEnabled(False)
+            try:
+                picker.clear()
+                picker.addItems(self.templates.sorted_names())
+            finally:
+                picker.setUpdatesEnabled(True)
 
     def get_selected_template_task(self) -> dict | None:
         name = self.templatePicker.currentText().strip()
@@ -535,8 +1223,9 @@ class MainWindow(QtWidgets.QMainWindow):
             return
         task = dict(task)
         task.setdefault("repo", self.repo_dir())
-        tool_names = get_tool_names_from_config(self.repo_dir())
-        dlg = AddTaskDialog(self.repo_dir(), tool_names, seed=task, parent=self)
+        dlg = AddTaskDialog(
+            self.repo_dir(), seed=task, parent=self, tool_model=self._tool_model()
+        )
         if dlg.exec() == QtWidgets.QDialog.DialogCode.Accepted:
             self.enqueue_task_dict(dlg.build_task())
 
@@ -546,70 +1235,88 @@ class MainWindow(QtWidgets.QMainWindow):
         )
         if not path:
             return
-        self.templates.load(path)
+        self.templates.load_async(path)
 
     def try_load_default_templates(self):
         path = os.path.join(self.repo_dir(), DEFAULT_TEMPLATES_REL)
         if os.path.exists(path):
-            self.templates.load(path)
+            self.templates.load_async(path)
+
+    def _tool_model(self) -> QtCore.QStringListModel:
+        # get_tool_names_from_config is stat-cached; only reset the model on change
+        names = get_tool_names_from_config(self.repo_dir())
+        if names != self._toolModel.stringList():
+            self._toolModel.setStringList(names)
+        return self._toolModel
 
     # ===== Task enqueue & retry =====
     def add_task(self):
-        tool_names = get_tool_names_from_config(self.repo_dir())
-        dlg = AddTaskDialog(self.repo_dir(), tool_names, parent=self)
+        dlg = AddTaskDialog(self.repo_dir(), parent=self, tool_model=self._tool_model())
         if dlg.exec() == QtWidgets.QDialog.DialogCode.Accepted:
             self.enqueue_task_dict(dlg.build_task())
 
     def enqueue_task_dict(self, task: dict):
         inbox = os.path.join(self.tasks_dir(), "inbox")
-        os.makedirs(inbox, exist_ok=True)
+        self._ensure_dir(inbox)
         tid = task.get("id") or datetime.now().strftime("%Y%m%d%H%M%S")
         task["id"] = tid
         path = os.path.join(inbox, f"task_{tid}.jsonl")
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(json.dumps(task, ensure_ascii=False) + "\n")
-        QtWidgets.QMessageBox.information(self, "Queued", f"Task enqueued:\n{path}")
+        # Serialize here, write on the I/O pool; the dialog follows completion
+        job = _PoolJob(_write_file, path, _json_dumps(task) + b"\n")
+        job.signals.done.connect(self._on_task_written)
+        self._io_pool.start(job)
+
+    def _on_task_written(self, result: tuple[str, str]):
+        path, err = result
+        if err:
+            QtWidgets.QMessageBox.critical(self, "Error", f"Could not enqueue task:\n{path}\n{err}")
+        else:
+            QtWidgets.QMessageBox.information(self, "Queued", f"Task enqueued:\n{path}")
 
     def retry_failed(self):
-        self.refresh_dlq()  # loads lists
         inbox = os.path.join(self.tasks_dir(), "inbox")
-        os.makedirs(inbox, exist_ok=True)
+        self._ensure_dir(inbox)
         moved = 0
-        for lst in (self.failedList, self.quarantineList):
-            for i in range(lst.count()):
-                item = lst.item(i)
-                if not item:
-                    continue
-                p = item.data(QtCore.Qt.ItemDataRole.UserRole)
-                if p and os.path.isfile(p):
-                    try:
-                        shutil.move(p, os.path.join(inbox, os.path.basename(p)))
-                        moved += 1
-                    except Exception:
-                        pass
+        # Scan the folders directly; the list widgets refresh asynchronously
+        for folder in self._dlq_folders():
+            for _name, p, _mtime in _scan_jsonl(folder):
+                try:
+                    _move_file(p, os.path.join(inbox, os.path.basename(p)))
+                    moved += 1
+                except Exception:
+                    pass
+        self.refresh_dlq()
         QtWidgets.QMessageBox.information(self, "Retry", f"Moved {moved} files back to inbox.")
 
     # ===== DLQ inspector =====
+    def _dlq_folders(self) -> tuple[str, str]:
+        return (
+            os.path.join(self.tasks_dir(), "failed"),
+            os.path.join(self.tasks_dir(), "quarantine"),
+        )
+
     def refresh_dlq(self):
-        self.failedList.clear()
-        self.quarantineList.clear()
-        failed = os.path.join(self.tasks_dir(), "failed")
-        quarant = os.path.join(self.tasks_dir(), "quarantine")
-        for folder, widget in [(failed, self.failedList), (quarant, self.quarantineList)]:
-            if os.path.isdir(folder):
-                for name in sorted(os.listdir(folder)):
-                    if name.endswith(".jsonl"):
-                        p = os.path.join(folder, name)
-                        it = QtWidgets.QListWidgetItem(
-                            name
-                            + "  ("
-                            + datetime.fromtimestamp(os.path.getmtime(p)).strftime(
-                                "%Y-%m-%d %H:%M:%S"
-                            )
-                            + ")"
-                        )
-                        it.setData(QtCore.Qt.ItemDataRole.UserRole, p)
-                        widget.addItem(it)
+        # Directory scans run on the thread pool; only the newest scan is applied
+        self._dlqGen += 1
+        job = _PoolJob(_scan_dlq, self._dlqGen, self._dlq_folders())
+        job.signals.done.connect(self._apply_dlq_results)
+        QtCore.QThreadPool.globalInstance().start(job)
+
+    def _apply_dlq_results(self, result: tuple[int, list]):
+        gen, results = result
+        if gen != self._dlqGen:
+            return  # superseded by a later refresh
+        role = QtCore.Qt.ItemDataRole.UserRole
+        for widget, rows in zip((self.failedList, self.quarantineList), results, strict=True):
+            # One bulk insert with repaints suspended, then attach paths
+            widget.setUpdatesEnabled(False)
+            try:
+                widget.clear()
+                widget.addItems([f"{name}  ({_format_mtime(mtime)})" for name, _p, mtime in rows])
+                for i, (_name, p, _mtime) in enumerate(rows):
+                    widget.item(i).setData(role, p)
+            finally:
+                widget.setUpdatesEnabled(True)
 
     def delete_selected_dlq(self):
         # Confirmation
@@ -635,42 +1342,88 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def retry_selected_dlq(self):
         inbox = os.path.join(self.tasks_dir(), "inbox")
-        os.makedirs(inbox, exist_ok=True)
+        self._ensure_dir(inbox)
         moved = 0
         for lst in (self.failedList, self.quarantineList):
             for it in lst.selectedItems():
                 p = it.data(QtCore.Qt.ItemDataRole.UserRole)
                 try:
-                    shutil.move(p, os.path.join(inbox, os.path.basename(p)))
+                    _move_file(p, os.path.join(inbox, os.path.basename(p)))
                     moved += 1
                 except Exception:
                     pass
         self.refresh_dlq()
         QtWidgets.QMessageBox.information(self, "Retry", f"Moved {moved} file(s) to inbox.")
 
+    # ===== State files =====
+    def _read_json_cached(self, path: str):
+        """Parse a JSON state file, reusing the last result while its stat is unchanged.
+
+        Keyed on (st_mtime_ns, st_size); when only the stat changed, a hash of the
+        bytes avoids re-parsing a file rewritten with identical content. Raises
+        FileNotFoundError when the file is missing; read/parse errors propagate
+        and are not cached. Callers must not mutate the returned object.
+        """
+        st = os.stat(path)
+        sig = (st.st_mtime_ns, st.st_size)
+        hit = self._json_cache.get(path)
+        if hit is not None and hit[0] == sig:
+            return hit[2]
+        with open(path, "rb") as f:
+            raw = f.read()
+        digest = hash(raw)
+        if hit is not None and hit[1] == digest:
+            data = hit[2]
+        else:
+            data = _json_loads(raw)
+        self._json_cache[path] = (sig, digest, data)
+        return data
+
     # ===== Quarantine breakers =====
     def breakers_path(self) -> str:
         return os.path.join(self.state_dir(), "circuit_breakers.json")
 
     def refresh_breakers(self):
         path = self.breakers_path()
-        self.breakerView.setRowCount(0)
-        if not os.path.exists(path):
-            return
+        rows = []
         try:
-            data = json.load(open(path, "r", encoding="utf-8"))
-            if not isinstance(data, dict):
-                return
-            for tool, rec in sorted(data.items()):
-                r = self.breakerView.rowCount()
-                self.breakerView.insertRow(r)
-                state = rec.get("state", "?")
-                fails = rec.get("fails", "?")
-                until = rec.get("until", "")
-                for c, val in enumerate([tool, state, str(fails), until]):
-                    self.breakerView.setItem(r, c, QtWidgets.QTableWidgetItem(val))
+            data = self._read_json_cached(path)
+            if isinstance(data, dict):
+                for tool, rec in sorted(data.items()):
+                    rows.append(
+                        (
+                            tool,
+                            str(rec.get("state", "?")),
+                            str(rec.get("fails", "?")),
+                            str(rec.get("until") or ""),
+                        )
+                    )
         except Exception:
-            pass
+            pass  # missing or unreadable file: show an empty table
+        self._apply_breaker_rows(rows)
+
+    def _apply_breaker_rows(self, rows: list[tuple[str, str, str, str]]):
+        """Diff `rows` (sorted by tool) into breakerView instead of rebuilding it.
+
+        Only rows whose tool appeared/disappeared are inserted/removed and only
+        cells whose text changed are touched, so selection and scroll survive.
+        """
+        view = self.breakerView
+        wanted = {r[0] for r in rows}
+        for i in range(view.rowCount() - 1, -1, -1):
+            item = view.item(i, 0)
+            if item is None or item.text() not in wanted:
+                view.removeRow(i)
+        for r, values in enumerate(rows):
+            item = view.item(r, 0)
+            if item is None or item.text() != values[0]:
+                view.insertRow(r)
+            for c, val in enumerate(values):
+                item = view.item(r, c)
+                if item is None:
+                    view.setItem(r, c, QtWidgets.QTableWidgetItem(val))
+                elif item.text() != val:
+                    item.setText(val)
 
     def force_close_breaker(self):
         path = self.breakers_path()
@@ -678,7 +1431,9 @@ class MainWindow(QtWidgets.QMainWindow):
             QtWidgets.QMessageBox.information(self, "No file", "circuit_breakers.json not found")
             return
         try:
-            data = json.load(open(path, "r", encoding="utf-8"))
+            data = self._read_json_cached(path)
+            # About to be mutated and rewritten; don't let the cache share it
+            self._json_cache.pop(path, None)
             rows = {
                 self.breakerView.item(i, 0).text(): i for i in range(self.breakerView.rowCount())
             }
@@ -692,36 +1447,41 @@ class MainWindow(QtWidgets.QMainWindow):
                     data[t]["state"] = "closed"
                     data[t]["fails"] = 0
                     data[t]["until"] = datetime.now().isoformat()
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False)
+            _atomic_write_bytes(path, _json_dumps(data))
             self.refresh_breakers()
         except Exception as e:
             QtWidgets.QMessageBox.critical(self, "Error", str(e))
 
     # ===== Live log & filters =====
+    def clear_log(self):
+        # Drop the hidden-tab backlog too, or the next Show would replay it
+        self._hiddenLog.clear()
+        if hasattr(self, 'liveLog'):
+            self.liveLog.clear()
+
     def on_new_log_lines(self, lines: list[str]):
-        at_end = (
-            self.liveLog.verticalScrollBar().value() == self.liveLog.verticalScrollBar().maximum()
-        )
         tool_filter = self.filterTool.currentText().lower()
         text_filter = self.filterText.text().strip().lower()
-
+        # Needles built once per batch; each line is lowercased once and reused
+        tool_needles = None
+        if tool_filter != "all":
+            # heuristic: include if tool name appears in line, e.g., "[git]" or "git:" or " [git] "
+            tool_needles = (f"[{tool_filter}]", tool_filter + ":", " " + tool_filter + " ")
+
+        shown = []
+        errors = []
         for line in lines:
             low = line.lower()
-            # tool filter
-            if tool_filter != "all":
-                # heuristic: include if tool name appears in line, e.g., "[git]" or "git:" or " [git] "
-                if (
-                    f"[{tool_filter}]" not in low
-                    and (tool_filter + ":") not in low
-                    and (" " + tool_filter + " ") not in low
-                ):
-                    continue
-            # text filter
+            if tool_needles is not None and (
+                tool_needles[0] not in low
+                and tool_needles[1] not in low
+                and tool_needles[2] not in low
+            ):
+                continue
             if text_filter and text_filter not in low:
                 continue
 
-            self.liveLog.append(f'<span style="color:{color_for_line(line)}">{line}</span>')
+            shown.append(line)
 
             if "error" in low or "fail" in low or "timeout" in low:
                 hint_log = None
@@ -729,50 +1489,172 @@ class MainWindow(QtWidgets.QMainWindow):
                     if tok.startswith("task_") and tok.endswith(".log"):
                         hint_log = os.path.join(self.logs_dir(), tok)
                         break
-                it = QtWidgets.QListWidgetItem(line)
-                if hint_log:
-                    it.setData(QtCore.Qt.ItemDataRole.UserRole, hint_log)
-                it.setForeground(QtGui.QBrush(QtGui.QColor("#ff4444")))
-                self.errorsList.addItem(it)
-                if self.errorsList.count() > 200:
-                    self.errorsList.takeItem(0)
+                errors.append((line, hint_log))
 
-        if at_end:
-            self.liveLog.verticalScrollBar().setValue(self.liveLog.verticalScrollBar().maximum())
+        if errors:
+            self._add_error_items(errors)
+
+        if not self.liveLog.isVisible():
+            # Errors stay current; document formatting waits until the log is shown
+            self._hiddenLog.extend(shown)
+            return
+        self._append_log(shown)
+
+    def _append_log(self, shown):
+        if not shown:
+            return
+        at_end = (
+            self.liveLog.verticalScrollBar().value() == self.liveLog.verticalScrollBar().maximum()
+        )
+        doc = self.liveLog.document()
+        # Lines beyond the block cap would be trimmed right away; don't format them
+        max_blocks = doc.maximumBlockCount()
+        if max_blocks > 0 and len(shown) > max_blocks:
+            shown = list(shown)[-max_blocks:]
+
+        # Append the whole batch through one cursor edit block with cached plain-text
+        # formats; works for QTextEdit and QPlainTextEdit alike and avoids a rich-text
+        # relayout per line.
+        cursor = QtGui.QTextCursor(doc)
+        cursor.movePosition(QtGui.QTextCursor.MoveOperation.End)
+        need_break = not doc.isEmpty()
+        # Repaint once after the batch and the scroll, not per edit
+        self.liveLog.setUpdatesEnabled(False)
+        try:
+            cursor.beginEditBlock()
+            for line in shown:
+                if need_break:
+                    cursor.insertBlock()
+                cursor.insertText(line, self._log_format(color_for_line(line)))
+                need_break = True
+            cursor.endEditBlock()
+
+            if at_end:
+                bar = self.liveLog.verticalScrollBar()
+                bar.setValue(bar.maximum())
+        finally:
+            self.liveLog.setUpdatesEnabled(True)
+
+    def eventFilter(self, obj, event):
+        if (
+            event.type() == QtCore.QEvent.Type.Show
+            and obj is getattr(self, "liveLog", None)
+            and self._hiddenLog
+        ):
+            backlog = list(self._hiddenLog)
+            self._hiddenLog.clear()
+            self._append_log(backlog)
+        return super().eventFilter(obj, event)
+
+    def _log_format(self, color: str) -> QtGui.QTextCharFormat:
+        fmt = self._logFormats.get(color)
+        if fmt is None:
+            fmt = QtGui.QTextCharFormat()
+            fmt.setForeground(QtGui.QBrush(QtGui.QColor(color)))
+            self._logFormats[color] = fmt
+        return fmt
 
     # ===== Ledger & heartbeat =====
     def load_ledger(self):
-        self.ledgerList.clear()
-        ledger = os.path.join(self.logs_dir(), "ledger.jsonl")
-        if not os.path.exists(ledger):
-            self.ledgerList.addItem("ledger.jsonl not found")
+        if self._ledgerBusy:
+            self._ledgerAgain = True  # re-run once the in-flight parse lands
             return
+        self._ledgerBusy = True
+        job = _PoolJob(
+            _parse_ledger,
+            os.path.join(self.logs_dir(), "ledger.jsonl"),
+            self._ledger_sig,
+            self._ledger_pos,
+        )
+        job.signals.done.connect(self._on_ledger_parsed)
+        QtCore.QThreadPool.globalInstance().start(job)
+
+    def _on_ledger_parsed(self, result: dict):
+        self._ledgerBusy = False
+        if result.get("missing"):
+            self._reset_ledger_cache()
+            self._show_ledger_message("ledger.jsonl not found")
+        elif "error" in result:
+            self._ledger_synced = False
+            self._show_ledger_message(f"Error reading ledger: {result['error']}")
+        else:
+            if result["reset"]:
+                # New file, rotated or truncated: start over
+                self._reset_ledger_cache()
+            self._ledger_sig = result["sig"]
+            self._ledger_pos = result["pos"]
+            fresh = result["fresh"]
+            self._ledger_entries.extend(fresh)
+            lst = self.ledgerList
+            lst.setUpdatesEnabled(False)
+            try:
+                if self._ledger_synced:
+                    # Reuse the existing items: append new records, trim the oldest
+                    self._add_ledger_items(fresh)
+                    while lst.count() > LEDGER_TAIL:
+                        lst.takeItem(0)
+                else:
+                    lst.clear()
+                    self._add_ledger_items(self._ledger_entries)
+                    self._ledger_synced = True
+                    self._ledger_message = None
+            finally:
+                lst.setUpdatesEnabled(True)
+        if self._ledgerAgain:
+            self._ledgerAgain = False
+            self.load_ledger()
+
+    def _add_error_items(self, errors: list[tuple[str, str | None]]):
+        lst = self.errorsList
+        errors = errors[-200:]
+        lst.setUpdatesEnabled(False)
         try:
-            with open(ledger, "r", encoding="utf-8", errors="replace") as f:
-                lines = f.readlines()[-500:]
-            for ln in lines:
-                ln = ln.strip()
-                if not ln:
-                    continue
-                try:
-                    obj = json.loads(ln)
-                    ts = obj.get("ts", "")
-                    tid = obj.get("id", "")
-                    tool = obj.get("tool", "")
-                    ok = obj.get("ok", False)
-                    exitc = obj.get("exit", "")
-                    txt = f"{ts}  [{tool}] id={tid}  {'OK' if ok else 'FAIL'} (code={exitc})"
-                    it = QtWidgets.QListWidgetItem(txt)
-                    it.setForeground(QtGui.QBrush(QtGui.QColor("#44bb44" if ok else "#ff4444")))
-                    self.ledgerList.addItem(it)
-                except Exception:
-                    self.ledgerList.addItem(ln)
-        except Exception as e:
-            self.ledgerList.addItem(f"Error reading ledger: {e}")
+            start = lst.count()
+            lst.addItems([line for line, _hint in errors])
+            brush = QtGui.QBrush(QtGui.QColor("#ff4444"))
+            for i, (_line, hint_log) in enumerate(errors, start):
+                it = lst.item(i)
+                if hint_log:
+                    it.setData(QtCore.Qt.ItemDataRole.UserRole, hint_log)
+                it.setForeground(brush)
+            while lst.count() > 200:
+                lst.takeItem(0)
+        finally:
+            lst.setUpdatesEnabled(True)
+
+    def _show_ledger_message(self, text: str):
+        # Repeated refreshes of a missing ledger keep the existing placeholder item
+        if self._ledger_message == text:
+            return
+        self.ledgerList.clear()
+        self.ledgerList.addItem(text)
+        self._ledger_message = text
+
+    def _reset_ledger_cache(self):
+        self._ledger_sig = None
+        self._ledger_pos = 0
+        self._ledger_entries.clear()
+        self._ledger_synced = False
+
+    def _add_ledger_items(self, entries):
+        # Bulk-insert the texts, then color only the items that need it
+        entries = list(entries)
+        lst = self.ledgerList
+        start = lst.count()
+        lst.addItems([txt for txt, _color in entries])
+        for i, (_txt, color) in enumerate(entries, start):
+            if color:
+                lst.item(i).setForeground(QtGui.QBrush(QtGui.QColor(color)))
 
     def check_heartbeat(self):
         hb = os.path.join(self.state_dir(), "heartbeat.json")
-        if not os.path.exists(hb):
+        try:
+            data = self._read_json_cached(hb)
+        except FileNotFoundError:
+            data = None
+        except Exception:
+            data = {}  # reported as unreadable below
+        if data is None:
             self.lblStatus.setText("No heartbeat")
             # Update buttons when not running (respect a short cooldown)
             cd = False
@@ -788,7 +1670,6 @@ class MainWindow(QtWidgets.QMainWindow):
                 pass
             return
         try:
-            data = json.load(open(hb, "r", encoding="utf-8"))
             ts_raw = data.get("timestamp", "")
             if not ts_raw:
                 self.lblStatus.setText("Heartbeat: unreadable")
@@ -798,7 +1679,10 @@ class MainWindow(QtWidgets.QMainWindow):
                 except Exception:
                     pass
                 return
-            ts = datetime.fromisoformat(ts_raw.replace("Z", "+00:00"))
+            # The file only changes when the worker beats; parse each timestamp once
+            if self._hbParsed[0] != ts_raw:
+                self._hbParsed = (ts_raw, _parse_iso(ts_raw))
+            ts = self._hbParsed[1]
             age = (datetime.now(timezone.utc) - ts.astimezone(timezone.utc)).total_seconds()
             pid = data.get("pid", "?")
             self.lblStatus.setText(f"Heartbeat: {int(age)}s ago  |  PID {pid}")
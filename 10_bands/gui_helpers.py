@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import os
+import re
 import shutil
 import subprocess
 from typing import Optional
@@ -11,6 +12,13 @@ DEF_TASKS = ".tasks"
 DEF_LOGS = "logs"
 STATE_DIR = ".state"
 
+# Compiled once; the config readers run on every dialog open / path refresh
+_RE_TOOL_NAME = re.compile(r"Name\s*=\s*'(.*?)'")
+# Tool names per config path, reused while (st_mtime_ns, st_size) is unchanged
+_TOOL_NAMES_CACHE: dict[str, tuple[tuple[int, int], tuple[str, ...]]] = {}
+# One pass over SharedConfig.psd1 for all three roots
+_RE_SHARED_PATH = re.compile(r"(?P<key>TasksRoot|LogsRoot|StateRoot)\s*=\s*'(?P<value>[^']+)'")
+
 
 def get_tool_names_from_config(repo_path: str) -> list[str]:
     """Parse simple Name fields from Config/CliToolsConfig.psd1.
@@ -18,14 +26,19 @@ def get_tool_names_from_config(repo_path: str) -> list[str]:
     This uses a lightweight regex approach tailored for the expected file format.
     """
     config_path = os.path.join(repo_path, "Config", "CliToolsConfig.psd1")
-    if not os.path.exists(config_path):
+    try:
+        st = os.stat(config_path)
+    except OSError:
         return []
+    sig = (st.st_mtime_ns, st.st_size)
+    hit = _TOOL_NAMES_CACHE.get(config_path)
+    if hit is not None and hit[0] == sig:
+        return list(hit[1])
     try:
         with open(config_path, "r", encoding="utf-8") as f:
             content = f.read()
-        import re
-
-        tool_names = re.findall(r"Name\s*=\s*\'(.*?)\'", content)
+        tool_names = _RE_TOOL_NAME.findall(content)
+        _TOOL_NAMES_CACHE[config_path] = (sig, tuple(tool_names))
         return tool_names
     except Exception:
         return []
@@ -79,13 +92,12 @@ def _read_shared_paths_fallback(repo_path: str) -> Optional[dict]:
         txt = open(psd1, "r", encoding="utf-8").read()
     except Exception:
         return None
-    import re
-
     paths_block = {}
-    for key in ("TasksRoot", "LogsRoot", "StateRoot"):
-        m = re.search(rf"{key}\s*=\s*'([^']+)'", txt)
-        if m:
-            paths_block[key] = m.group(1)
+    for m in _RE_SHARED_PATH.finditer(txt):
+        # First occurrence wins, as with a per-key search
+        paths_block.setdefault(m.group("key"), m.group("value"))
+        if len(paths_block) == 3:
+            break
     return paths_block or None
 
 
@@ -0,0 +1,87 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+PyQt6 = pytest.importorskip("PyQt6")
+from PyQt6 import QtCore, QtWidgets  # noqa: E402
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from QueueManagerGUI_v2 import AddTaskDialog, _join_args, _split_args  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def qt_app():
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication([])
+    yield app
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("status -sb", ["status", "-sb"]),
+        ('commit -m "two words"', ["commit", "-m", "two words"]),
+        (r'"C:\Program Files\tool.exe" --x', [r"C:\Program Files\tool.exe", "--x"]),
+        ('"unbalanced', ['"unbalanced']),
+        ("-m it's fine and it's done", ["-m", "it's", "fine", "and", "it's", "done"]),
+        ("fix don't won't", ["fix", "don't", "won't"]),
+        ('say "it\'s done" now', ["say", "it's done", "now"]),
+    ],
+)
+def test_split_args(text, expected):
+    assert _split_args(text) == expected
+
+
+def test_seeded_args_round_trip(qt_app):
+    seed = {"tool": "git", "args": ["commit", "-m", "two words"], "flags": ["--yes"]}
+    dlg = AddTaskDialog("/repo", ["git"], seed=seed)
+
+    task = dlg.build_task()
+    assert task["args"] == ["commit", "-m", "two words"]
+    assert task["flags"] == ["--yes"]
+
+    dlg.args.setText(dlg.args.text() + " --amend")
+    assert dlg.build_task()["args"] == ["commit", "-m", "two words", "--amend"]
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        ["a'b", "c'd"],
+        ["it's", "two words"],
+        ["", "--x"],
+    ],
+)
+def test_join_args_round_trips(values):
+    assert _split_args(_join_args(values)) == values
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        ['--format="%h"'],
+        ['say "hi" now'],
+        ["a'b", "c'd"],
+    ],
+)
+def test_seeded_quote_values_survive_unedited(qt_app, values):
+    dlg = AddTaskDialog("/repo", ["git"], seed={"tool": "git", "args": values})
+    assert dlg.build_task()["args"] == values
+
+
+def test_seeded_apostrophes_survive_edit(qt_app):
+    dlg = AddTaskDialog("/repo", ["git"], seed={"tool": "git", "args": ["a'b", "c'd"]})
+    dlg.args.setText(dlg.args.text() + " --x")
+    assert dlg.build_task()["args"] == ["a'b", "c'd", "--x"]
+
+
+def test_dialog_uses_shared_tool_model_without_tool_names(qt_app):
+    model = QtCore.QStringListModel(["git", "aider"])
+    dlg = AddTaskDialog("/repo", tool_model=model)
+    assert dlg.tool.model() is model
+    assert dlg.build_task()["tool"] == "git"
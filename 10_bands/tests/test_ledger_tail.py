@@ -0,0 +1,33 @@
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+PyQt6 = pytest.importorskip("PyQt6")
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from QueueManagerGUI_v2 import LEDGER_TAIL, LEDGER_TAIL_WINDOW, _ledger_tail_start  # noqa: E402
+
+
+def _ledger(n: int) -> bytes:
+    return b"".join(b'{"id": %d, "status": "completed"}\n' % i for i in range(n))
+
+
+def test_small_ledger_is_read_from_the_start():
+    data = _ledger(LEDGER_TAIL + 1)
+    assert len(data) < LEDGER_TAIL_WINDOW
+    assert _ledger_tail_start(io.BytesIO(data), len(data)) == 0
+
+
+def test_large_ledger_starts_on_a_line_boundary_with_enough_lines():
+    data = _ledger(50_000)
+    start = _ledger_tail_start(io.BytesIO(data), len(data))
+    assert start > 0
+    assert data[start - 1 : start] == b"\n"
+    tail = data[start:].splitlines()
+    assert len(tail) >= LEDGER_TAIL
+    assert tail[-1] == b'{"id": 49999, "status": "completed"}'
@@ -0,0 +1,31 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+PyQt6 = pytest.importorskip("PyQt6")
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from QueueManagerGUI_v2 import color_for_line  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        ("[ERROR] task_1 crashed", "#ff4444"),
+        ("request Timeout after 30s", "#ff4444"),
+        ("quality gate: FAIL", "#ff4444"),
+        ("step FAIL retrying", "#ff4444"),
+        ("failover complete", "#cccccc"),
+        ("WARN: disk almost full", "#ffaa00"),
+        ("Quality Gate: OK", "#44bb44"),
+        ("ok but warning follows", "#ffaa00"),
+        ("success then error", "#ff4444"),
+        ("idle", "#cccccc"),
+    ],
+)
+def test_color_for_line_priorities(line, expected):
+    assert color_for_line(line) == expected
@@ -30,12 +30,14 @@ def test_logtailer_reads_incrementally(tmp_path, qt_app):
     tailer.new_lines.connect(lambda lines: captured.extend(lines))
 
     tailer._poll()
+    tailer._flush()
     assert captured == ["first line", "second line"]
 
     with log_file.open("a", encoding="utf-8") as handle:
         handle.write("third line\n")
 
     tailer._poll()
+    tailer._flush()
     assert captured[-1] == "third line"
     assert captured.count("third line") == 1
 
@@ -49,11 +51,113 @@ def test_logtailer_detects_rotation(tmp_path, qt_app):
     tailer.new_lines.connect(lambda lines: captured.extend(lines))
 
     tailer._poll()
+    tailer._flush()
     assert captured == ["alpha"]
 
     # Simulate rotation by truncating the file with new content
     log_file.write_text("beta\n", encoding="utf-8")
     tailer._poll()
+    tailer._flush()
 
     assert captured[-1] == "beta"
     assert captured.count("beta") == 1
+
+
+def test_logtailer_coalesces_reads_into_one_emit(tmp_path, qt_app):
+    log_file = tmp_path / "worker.log"
+    log_file.write_text("one\n", encoding="utf-8")
+
+    tailer = LogTailer(str(log_file), poll_ms=5)
+    batches = []
+    tailer.new_lines.connect(batches.append)
+
+    tailer._poll()
+    with log_file.open("a", encoding="utf-8") as handle:
+        handle.write("two\n")
+    tailer._poll()
+    assert batches == []
+
+    tailer._flush()
+    assert batches == [["one", "two"]]
+
+
+def test_logtailer_holds_partial_line_until_newline(tmp_path, qt_app):
+    log_file = tmp_path / "worker.log"
+    log_file.write_text("done\nhalf", encoding="utf-8")
+
+    tailer = LogTailer(str(log_file), poll_ms=5)
+    captured = []
+    tailer.new_lines.connect(lambda lines: captured.extend(lines))
+
+    tailer._poll()
+    tailer._flush()
+    assert captured == ["done"]
+
+    with log_file.open("a", encoding="utf-8") as handle:
+        handle.write(" a line\n")
+    tailer._poll()
+    tailer._flush()
+    assert captured == ["done", "half a line"]
+
+
+def test_logtailer_caps_lines_per_emit(tmp_path, qt_app):
+    import QueueManagerGUI_v2 as gui
+
+    log_file = tmp_path / "worker.log"
+    total = gui.TAILER_MAX_BATCH + 7
+    log_file.write_text("".join(f"line {i}\n" for i in range(total)), encoding="utf-8")
+
+    tailer = LogTailer(str(log_file), poll_ms=5)
+    batches = []
+    tailer.new_lines.connect(batches.append)
+
+    tailer._poll()
+    tailer._flush()
+    assert len(batches) == 1 and len(batches[0]) == gui.TAILER_MAX_BATCH
+    tailer._flush()
+    assert len(batches[1]) == 7
+    assert batches[1][-1] == f"line {total - 1}"
+
+
+def test_logtailer_strips_ansi_sequences(tmp_path, qt_app):
+    log_file = tmp_path / "worker.log"
+    log_file.write_text("\x1b[31mERROR\x1b[0m task failed\n\x1b[2K\n", encoding="utf-8")
+
+    tailer = LogTailer(str(log_file), poll_ms=5)
+    captured = []
+    tailer.new_lines.connect(lambda lines: captured.extend(lines))
+
+    tailer._poll()
+    tailer._flush()
+    assert captured == ["ERROR task failed"]
+
+
+def test_logtailer_reassembles_characters_split_across_reads(tmp_path, qt_app, monkeypatch):
+    import QueueManagerGUI_v2 as gui
+
+    monkeypatch.setattr(gui, "TAILER_READ_CHUNK", 3)
+    log_file = tmp_path / "worker.log"
+    log_file.write_bytes("héllo wörld\n✓ ok\n".encode("utf-8"))
+
+    tailer = LogTailer(str(log_file), poll_ms=5)
+    captured = []
+    tailer.new_lines.connect(lambda lines: captured.extend(lines))
+
+    tailer._poll()
+    tailer._flush()
+    assert captured == ["héllo wörld", "✓ ok"]
+
+
+def test_logtailer_poll_rearms_dropped_watch(tmp_path, qt_app):
+    log_file = tmp_path / "worker.log"
+    log_file.write_text("one\n", encoding="utf-8")
+
+    tailer = LogTailer(str(log_file), poll_ms=5)
+    tailer.start()
+    # Simulate the watch Qt drops when a writer swaps the file without notifying
+    tailer._watcher.removePath(str(log_file))
+    assert str(log_file) not in tailer._watcher.files()
+
+    tailer._poll()
+    assert str(log_file) in tailer._watcher.files()
+    tailer.stop()
@@ -0,0 +1,31 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+PyQt6 = pytest.importorskip("PyQt6")
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from QueueManagerGUI_v2 import _move_file  # noqa: E402
+
+
+def test_move_file_recreates_missing_destination_folder(tmp_path):
+    src = tmp_path / "failed" / "task_1.jsonl"
+    src.parent.mkdir()
+    src.write_text("{}\n", encoding="utf-8")
+    dst = tmp_path / ".tasks" / "inbox" / "task_1.jsonl"
+
+    _move_file(str(src), str(dst))
+
+    assert dst.read_text(encoding="utf-8") == "{}\n"
+    assert not src.exists()
+
+
+def test_move_file_missing_source_raises(tmp_path):
+    dst = tmp_path / "inbox" / "task_1.jsonl"
+    with pytest.raises(FileNotFoundError):
+        _move_file(str(tmp_path / "gone.jsonl"), str(dst))
+    assert not dst.parent.exists()
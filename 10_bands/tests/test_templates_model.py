@@ -5,7 +5,7 @@ from pathlib import Path
 import pytest
 
 PyQt6 = pytest.importorskip("PyQt6")
-from PyQt6 import QtWidgets  # noqa: E402
+from PyQt6 import QtCore, QtWidgets  # noqa: E402
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
@@ -66,3 +66,60 @@ def test_templates_model_builtin_seed(qt_app):
     assert emitted, "builtin should emit change notification"
     assert "Git: fetch + prune" in model.templates
     assert model.templates["Quality Gate"]["tool"] == "pwsh"
+
+
+def test_templates_model_revision_tracks_reloads(tmp_path, qt_app):
+    template_path = tmp_path / "templates.json"
+    template_path.write_text(json.dumps({"b": {}, "a": {}}), encoding="utf-8")
+
+    model = TemplatesModel()
+    model.builtin()
+    rev = model.revision
+    names = model.sorted_names()
+    assert names == sorted(names)
+    assert model.sorted_names() is names, "unchanged templates reuse the sorted list"
+
+    model.load(str(template_path))
+
+    assert model.revision == rev + 1
+    assert model.sorted_names() == ["a", "b"]
+
+
+def test_templates_model_accepts_utf8_bom(tmp_path, qt_app):
+    template_path = tmp_path / "templates.json"
+    template_path.write_bytes(b"\xef\xbb\xbf" + json.dumps({"Bom": {"tool": "git"}}).encode())
+
+    model = TemplatesModel()
+    model.load(str(template_path))
+
+    assert model.templates == {"Bom": {"tool": "git"}}
+
+
+def test_templates_model_reload_of_unchanged_file_is_a_no_op(tmp_path, qt_app):
+    template_path = tmp_path / "templates.json"
+    template_path.write_text(json.dumps({"One": {"tool": "git"}}), encoding="utf-8")
+
+    model = TemplatesModel()
+    model.load(str(template_path))
+    rev = model.revision
+    model.load(str(template_path))
+    assert model.revision == rev
+
+    model.builtin()
+    model.load(str(template_path))
+    assert model.templates == {"One": {"tool": "git"}}
+
+
+def test_templates_model_load_async_applies_latest(tmp_path, qt_app):
+    first = tmp_path / "first.json"
+    second = tmp_path / "second.json"
+    first.write_text(json.dumps({"First": {"tool": "git"}}), encoding="utf-8")
+    second.write_text(json.dumps({"Second": {"tool": "pwsh"}}), encoding="utf-8")
+
+    model = TemplatesModel()
+    model.load_async(str(first))
+    model.load_async(str(second))
+    QtCore.QThreadPool.globalInstance().waitForDone()
+    qt_app.processEvents()
+
+    assert model.templates == {"Second": {"tool": "pwsh"}}